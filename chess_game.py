@@ -1,101 +1,368 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog
 import enum
+import array
+import random
 
 
-class Color(enum.Enum):
-    WHITE = 'white'
-    BLACK = 'black'
+class Color(enum.IntEnum):
+    WHITE = 0
+    BLACK = 1
 
-class PieceType(enum.Enum):
-    PAWN = 'pawn'
-    ROOK = 'rook'
-    KNIGHT = 'knight'
-    BISHOP = 'bishop'
-    QUEEN = 'queen'
-    KING = 'king'
+class PieceType(enum.IntEnum):
+    PAWN = 0
+    ROOK = 1
+    KNIGHT = 2
+    BISHOP = 3
+    QUEEN = 4
+    KING = 5
+
+COLORS = tuple(Color)
+PIECE_TYPES = tuple(PieceType)
+
+BOARD_SIZE = 8
+# ~(BOARD_SIZE - 1) has no bits set inside [0, BOARD_SIZE) since the size
+# is a power of two, so one AND rejects any off-board row or column.
+BOUNDS_MASK = ~(BOARD_SIZE - 1)
+
+# A piece is encoded in one byte: the low four bits hold its bitboard
+# index (color * 6 + piece_type) and HAS_MOVED is set after its first move.
+PIECE_CODE_MASK = 0x0F
+HAS_MOVED = 0x10
+SYMBOLS = (
+    '♙', '♖', '♘', '♗', '♕', '♔',
+    '♟', '♜', '♞', '♝', '♛', '♚'
+)
+
+PIECE_VALUES = (1, 5, 3, 3, 9, 0)
+
+# Moves are packed into a single int:
+#   bits 0-5 from square, 6-11 to square, 12-15 piece code,
+#   16-19 captured piece code (NO_PIECE if none), 20-23 flags.
+# Six bits per square is why ChessBoard only supports 8x8 boards.
+NO_PIECE = 0x0F
+MOVE_FIRST = 0x1
+
+def decode_move(move):
+    """
+    Unpack a move recorded in ChessBoard.move_history.
+    
+    Args:
+        move (int): Packed move
+    
+    Returns:
+        tuple: (from_sq, to_sq, piece_code, captured_code, flags)
+    """
+    return (move & 0x3F, (move >> 6) & 0x3F, (move >> 12) & 0x0F,
+            (move >> 16) & 0x0F, (move >> 20) & 0x0F)
+
+KNIGHT_DELTAS = ((-2, -1), (-2, 1), (-1, -2), (-1, 2),
+                 (1, -2), (1, 2), (2, -1), (2, 1))
+KING_DELTAS = ((-1, -1), (-1, 0), (-1, 1), (0, -1),
+               (0, 1), (1, -1), (1, 0), (1, 1))
+PAWN_DELTAS = (((-1, -1), (-1, 1)), ((1, -1), (1, 1)))
+ROOK_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+BISHOP_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+QUEEN_DIRECTIONS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+
+def _build_attack_table(deltas):
+    """
+    Build a 64-entry table of attack bitboards for a non-sliding piece.
+    """
+    table = [0] * 64
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        for d_row, d_col in deltas:
+            r, c = row + d_row, col + d_col
+            if 0 <= r < 8 and 0 <= c < 8:
+                table[sq] |= 1 << (r * 8 + c)
+    return table
+
+KNIGHT_ATTACKS = _build_attack_table(KNIGHT_DELTAS)
+KING_ATTACKS = _build_attack_table(KING_DELTAS)
+PAWN_ATTACKS = [_build_attack_table(deltas) for deltas in PAWN_DELTAS]
+
+def _sliding_attacks(sq, occupied, directions):
+    """
+    Walk each ray from a square until it leaves the board or hits a piece.
+    
+    Args:
+        sq (int): Square the sliding piece stands on
+        occupied (int): Bitboard of all occupied squares
+        directions (tuple): (d_row, d_col) steps to walk
+    
+    Returns:
+        int: Bitboard of attacked squares, including the first blocker
+    """
+    attacks = 0
+    row, col = divmod(sq, BOARD_SIZE)
+    for d_row, d_col in directions:
+        r, c = row + d_row, col + d_col
+        while not (r | c) & BOUNDS_MASK:
+            bit = 1 << (r * BOARD_SIZE + c)
+            attacks |= bit
+            if occupied & bit:
+                break
+            r += d_row
+            c += d_col
+    return attacks
+
+SLIDING_DIRECTIONS = {
+    PieceType.ROOK: ROOK_DIRECTIONS,
+    PieceType.BISHOP: BISHOP_DIRECTIONS,
+    PieceType.QUEEN: QUEEN_DIRECTIONS,
+}
 
 class ChessPiece:
-    def __init__(self, piece_type, color, row, col):
-        """
-        Represents a chess piece with its type, color, and current position.
-        """
-        self.type = piece_type
-        self.color = color
-        self.row = row
-        self.col = col
-        self.has_moved = False
-        self.symbol = self._get_symbol()
-
-    def _get_symbol(self):
-        """
-        Returns the Unicode symbol for the piece based on its type and color.
-        """
-        symbols = {
-            Color.WHITE: {
-                PieceType.PAWN: '♙', 
-                PieceType.ROOK: '♖', 
-                PieceType.KNIGHT: '♘',
-                PieceType.BISHOP: '♗', 
-                PieceType.QUEEN: '♕', 
-                PieceType.KING: '♔'
-            },
-            Color.BLACK: {
-                PieceType.PAWN: '♟', 
-                PieceType.ROOK: '♜', 
-                PieceType.KNIGHT: '♞',
-                PieceType.BISHOP: '♝', 
-                PieceType.QUEEN: '♛', 
-                PieceType.KING: '♚'
-            }
-        }
-        return symbols[self.color][self.type]
-
-    def get_possible_moves(self, board):
-        """
-        Generate possible moves for the piece. 
-        To be implemented for each piece type.
-        """
-        raise NotImplementedError("Subclasses must implement this method")
+    __slots__ = ('board', 'index')
+
+    def __init__(self, board, index):
+        """
+        Represents a chess piece as a view onto the board's piece arrays.
+        
+        Args:
+            board (ChessBoard): The board that owns the piece
+            index (int): Index of the piece in the board's piece arrays
+        """
+        self.board = board
+        self.index = index
+
+    @property
+    def code(self):
+        return self.board.pieces[self.index] & PIECE_CODE_MASK
+
+    @property
+    def type(self):
+        return PIECE_TYPES[self.code % 6]
+
+    @property
+    def color(self):
+        return COLORS[self.code // 6]
+
+    @property
+    def row(self):
+        return self.board.positions[self.index] // BOARD_SIZE
+
+    @property
+    def col(self):
+        return self.board.positions[self.index] % BOARD_SIZE
+
+    @property
+    def has_moved(self):
+        return bool(self.board.pieces[self.index] & HAS_MOVED)
+
+    @property
+    def symbol(self):
+        return SYMBOLS[self.board.pieces[self.index] & PIECE_CODE_MASK]
+
+    def get_possible_moves(self):
+        """
+        Generate possible moves for the piece.
+        
+        Knight, king and pawn moves are looked up in the precomputed
+        attack tables; rook, bishop and queen moves walk their rays
+        until blocked.
+        
+        Returns:
+            int: Bitboard of destination squares
+        """
+        board = self.board
+        code = board.pieces[self.index]
+        sq = board.positions[self.index]
+        color_index, piece_index = divmod(code & PIECE_CODE_MASK, 6)
+        
+        if piece_index == PieceType.KNIGHT:
+            return KNIGHT_ATTACKS[sq] & ~board.occ_by_color[color_index]
+        
+        if piece_index == PieceType.KING:
+            return KING_ATTACKS[sq] & ~board.occ_by_color[color_index]
+        
+        if piece_index == PieceType.PAWN:
+            moves = PAWN_ATTACKS[color_index][sq] & board.occ_by_color[color_index ^ 1]
+            step = 8 if color_index else -8
+            push = sq + step
+            if 0 <= push < 64 and not (board.occ_all >> push) & 1:
+                moves |= 1 << push
+                double_push = push + step
+                if (not code & HAS_MOVED and 0 <= double_push < 64 and
+                        not (board.occ_all >> double_push) & 1):
+                    moves |= 1 << double_push
+            return moves
+        
+        return (_sliding_attacks(sq, board.occ_all, SLIDING_DIRECTIONS[piece_index])
+                & ~board.occ_by_color[color_index])
+
+_ZOBRIST_RNG = random.Random(0x5EED)
 
 class ChessBoard:
-    def __init__(self, size=8):
+    # Random keys XORed into the position hash: one per square and piece
+    # code, plus one for black to move. Seeded so hashes are reproducible.
+    ZOBRIST = [[_ZOBRIST_RNG.getrandbits(64) for _ in range(12)]
+               for _ in range(64)]
+    ZOBRIST_TURN = _ZOBRIST_RNG.getrandbits(64)
+
+    TT_EXACT = 0
+    TT_LOWER = 1
+    TT_UPPER = 2
+    TT_MAX_ENTRIES = 1 << 20
+
+    def __init__(self, size=BOARD_SIZE):
         """
         Initialize the chess board with pieces in their starting positions.
+
+        Piece positions are stored as one bitboard per color/piece type,
+        indexed by ``color * 6 + piece_type``, where bit ``row * 8 + col``
+        is set when a piece occupies that square.
+
+        Pieces themselves are kept as parallel arrays: ``pieces`` holds one
+        byte per piece (the bitboard index in the low four bits plus the
+        HAS_MOVED flag), ``positions`` holds its square (-1 once captured)
+        and ``piece_at`` maps each square back to a piece index (-1 if
+        empty); both are signed-byte arrays sized for the 8x8 board.
+        Moves are recorded as packed ints in ``move_history``, with
+        captured piece indices pushed onto ``captured`` for undo.
+        ``hash`` is the Zobrist hash of the position, updated incrementally.
+        ``current_turn`` is the plain int value of the Color to move, so it
+        can be flipped with XOR and still compares equal to Color members.
+        
+        Raises:
+            ValueError: If size is not 8
         """
+        # The Zobrist keys, attack tables, 6-bit move fields and the
+        # signed-byte square arrays (which top out at 127) all assume
+        # exactly 64 squares.
+        if size != BOARD_SIZE:
+            raise ValueError(f"Only 8x8 boards are supported, got size {size}")
+        
         self.size = size
-        self.board = [[None for _ in range(size)] for _ in range(size)]
+        self.bb = [0] * 12
+        self.occ_by_color = [0, 0]
+        self.occ_all = 0
+        self.pieces = array.array('B')
+        self.positions = array.array('b')
+        self.piece_at = array.array('b', [-1] * (BOARD_SIZE * BOARD_SIZE))
         self._setup_board()
-        self.current_turn = Color.WHITE
-        self.move_history = []
+        self.current_turn = int(Color.WHITE)
+        self.move_history = array.array('I')
+        self.captured = array.array('b')
+        self.hash = self._compute_hash()
+        self.tt = {}
+
+    @property
+    def occ_white(self):
+        return self.occ_by_color[0]
+
+    @property
+    def occ_black(self):
+        return self.occ_by_color[1]
+
+    def _place_piece(self, piece_type, color, row, col):
+        """
+        Add a piece to the piece arrays and set its bit in the piece,
+        color and occupancy bitboards.
+        """
+        sq = row * BOARD_SIZE + col
+        bit = 1 << sq
+        code = color * 6 + piece_type
+        self.bb[code] |= bit
+        self.occ_by_color[color] |= bit
+        self.occ_all |= bit
+        self.piece_at[sq] = len(self.pieces)
+        self.pieces.append(code)
+        self.positions.append(sq)
 
     def _setup_board(self):
         """
         Place pieces in their initial positions.
         """
-        self.board[7][0] = ChessPiece(PieceType.ROOK, Color.WHITE, 7, 0)
-        self.board[7][1] = ChessPiece(PieceType.KNIGHT, Color.WHITE, 7, 1)
-        self.board[7][2] = ChessPiece(PieceType.BISHOP, Color.WHITE, 7, 2)
-        self.board[7][3] = ChessPiece(PieceType.QUEEN, Color.WHITE, 7, 3)
-        self.board[7][4] = ChessPiece(PieceType.KING, Color.WHITE, 7, 4)
-        self.board[7][5] = ChessPiece(PieceType.BISHOP, Color.WHITE, 7, 5)
-        self.board[7][6] = ChessPiece(PieceType.KNIGHT, Color.WHITE, 7, 6)
-        self.board[7][7] = ChessPiece(PieceType.ROOK, Color.WHITE, 7, 7)
-        
-        for col in range(self.size):
-            self.board[6][col] = ChessPiece(PieceType.PAWN, Color.WHITE, 6, col)
-        
-        self.board[0][0] = ChessPiece(PieceType.ROOK, Color.BLACK, 0, 0)
-        self.board[0][1] = ChessPiece(PieceType.KNIGHT, Color.BLACK, 0, 1)
-        self.board[0][2] = ChessPiece(PieceType.BISHOP, Color.BLACK, 0, 2)
-        self.board[0][3] = ChessPiece(PieceType.QUEEN, Color.BLACK, 0, 3)
-        self.board[0][4] = ChessPiece(PieceType.KING, Color.BLACK, 0, 4)
-        self.board[0][5] = ChessPiece(PieceType.BISHOP, Color.BLACK, 0, 5)
-        self.board[0][6] = ChessPiece(PieceType.KNIGHT, Color.BLACK, 0, 6)
-        self.board[0][7] = ChessPiece(PieceType.ROOK, Color.BLACK, 0, 7)
-        
-        for col in range(self.size):
-            self.board[1][col] = ChessPiece(PieceType.PAWN, Color.BLACK, 1, col)
+        back_rank = [
+            PieceType.ROOK, PieceType.KNIGHT, PieceType.BISHOP, PieceType.QUEEN,
+            PieceType.KING, PieceType.BISHOP, PieceType.KNIGHT, PieceType.ROOK
+        ]
+        for col, piece_type in enumerate(back_rank):
+            self._place_piece(piece_type, Color.WHITE, 7, col)
+        
+        for col in range(BOARD_SIZE):
+            self._place_piece(PieceType.PAWN, Color.WHITE, 6, col)
+        
+        for col, piece_type in enumerate(back_rank):
+            self._place_piece(piece_type, Color.BLACK, 0, col)
+        
+        for col in range(BOARD_SIZE):
+            self._place_piece(PieceType.PAWN, Color.BLACK, 1, col)
+
+    def _compute_hash(self):
+        """
+        Compute the Zobrist hash of the current position from scratch.
+        """
+        h = 0
+        for code, sq in zip(self.pieces, self.positions):
+            if sq >= 0:
+                h ^= self.ZOBRIST[sq][code & PIECE_CODE_MASK]
+        if self.current_turn == Color.BLACK:
+            h ^= self.ZOBRIST_TURN
+        return h
+
+    def tt_store(self, depth, value, flag):
+        """
+        Store a search result for the current position.
+        
+        Args:
+            depth (int): Search depth the value was computed at
+            value (int): Score of the position
+            flag (int): TT_EXACT, TT_LOWER or TT_UPPER
+        """
+        entry = self.tt.get(self.hash)
+        if entry is not None and entry[1] > depth:
+            return
+        if entry is None and len(self.tt) >= self.TT_MAX_ENTRIES:
+            del self.tt[next(iter(self.tt))]
+        self.tt[self.hash] = (value, depth, flag)
+
+    def tt_probe(self):
+        """
+        Look up the current position in the transposition table.
+        
+        Returns:
+            tuple: (value, depth, flag) if the position is stored, else None
+        """
+        return self.tt.get(self.hash)
+
+    def get_piece(self, row, col):
+        """
+        Return the piece on the given square, or None if it is empty.
+        """
+        index = self.piece_at[row * BOARD_SIZE + col]
+        return ChessPiece(self, index) if index >= 0 else None
+
+    def find_king(self, color):
+        """
+        Locate the king of the given color.
+        
+        Args:
+            color (Color): Color of the king
+        
+        Returns:
+            tuple: (row, col) of the king, or None if it is not on the board
+        """
+        king = self.bb[color * 6 + PieceType.KING]
+        if not king:
+            return None
+        return divmod(king.bit_length() - 1, BOARD_SIZE)
+
+    def count_pieces(self, color, piece_type):
+        """
+        Return how many pieces of the given color and type are on the board.
+        """
+        return self.bb[color * 6 + piece_type].bit_count()
+
+    def material(self, color):
+        """
+        Return the total material value of the given color's pieces.
+        """
+        base = color * 6
+        return sum(value * self.bb[base + piece_type].bit_count()
+                   for piece_type, value in enumerate(PIECE_VALUES))
 
     def is_valid_move(self, piece, new_row, new_col):
         """
@@ -109,15 +376,17 @@ class ChessBoard:
         Returns:
             bool: True if the move is valid, False otherwise
         """
-        if (new_row < 0 or new_row >= self.size or 
-            new_col < 0 or new_col >= self.size):
-            return False
-        
-        dest_piece = self.board[new_row][new_col]
-        if dest_piece and dest_piece.color == piece.color:
+        return self._is_valid_target(piece.color, new_row, new_col)
+
+    def _is_valid_target(self, color, new_row, new_col):
+        """
+        Integer-only core of is_valid_move, used by move_piece so the hot
+        path never builds a ChessPiece view.
+        """
+        if (new_row | new_col) & BOUNDS_MASK:
             return False
         
-        return True
+        return not (self.occ_by_color[color] >> (new_row * BOARD_SIZE + new_col)) & 1
 
     def move_piece(self, from_row, from_col, to_row, to_col):
         """
@@ -130,41 +399,129 @@ class ChessBoard:
             to_col (int): Destination column
         
         Returns:
-            bool: True if move was successful, False otherwise
+            tuple: ((from_row, from_col), (to_row, to_col)) for the move
+            made, or an empty tuple if the move was not made
         """
-        piece = self.board[from_row][from_col]
+        if (from_row | from_col) & BOUNDS_MASK:
+            return ()
         
-        if not piece:
-            return False
+        pieces = self.pieces
+        piece_at = self.piece_at
+        from_sq = from_row * BOARD_SIZE + from_col
+        index = piece_at[from_sq]
         
-        if piece.color != self.current_turn:
-            return False
+        if index < 0:
+            return ()
+        
+        piece_byte = pieces[index]
+        code = piece_byte & PIECE_CODE_MASK
+        color_index = code // 6
+        
+        if color_index != self.current_turn:
+            return ()
+        
+        if not self._is_valid_target(color_index, to_row, to_col):
+            return ()
+        
+        bb = self.bb
+        occ = self.occ_by_color
+        zobrist = self.ZOBRIST
+        to_sq = to_row * BOARD_SIZE + to_col
+        captured_index = piece_at[to_sq]
+        captured_code = NO_PIECE
+        flags = 0 if piece_byte & HAS_MOVED else MOVE_FIRST
+        
+        to_bit = 1 << to_sq
+        move_mask = (1 << from_sq) | to_bit
+        
+        zobrist_to = zobrist[to_sq]
+        h = self.hash ^ zobrist[from_sq][code] ^ zobrist_to[code] ^ self.ZOBRIST_TURN
+        
+        if captured_index >= 0:
+            captured_code = pieces[captured_index] & PIECE_CODE_MASK
+            h ^= zobrist_to[captured_code]
+            bb[captured_code] ^= to_bit
+            occ[color_index ^ 1] ^= to_bit
+            self.positions[captured_index] = -1
+            self.captured.append(captured_index)
+        
+        self.hash = h
+        bb[code] ^= move_mask
+        occ[color_index] ^= move_mask
+        self.occ_all = occ[0] | occ[1]
+        
+        self.positions[index] = to_sq
+        piece_at[to_sq] = index
+        piece_at[from_sq] = -1
+        pieces[index] = piece_byte | HAS_MOVED
+        
+        self.move_history.append(
+            from_sq | (to_sq << 6) | (code << 12) |
+            (captured_code << 16) | (flags << 20)
+        )
+        
+        self.current_turn ^= 1
+        
+        return (from_row, from_col), (to_row, to_col)
+
+    def iter_moves(self):
+        """
+        Iterate over the moves played so far, oldest first.
         
-        if not self.is_valid_move(piece, to_row, to_col):
+        Yields:
+            tuple: (from_sq, to_sq, piece_code, captured_code), where
+            captured_code is NO_PIECE for a non-capturing move
+        """
+        for move in self.move_history:
+            yield decode_move(move)[:4]
+
+    def undo_move(self):
+        """
+        Take back the last move played.
+        
+        Returns:
+            bool: True if a move was undone, False if there was none
+        """
+        if not self.move_history:
             return False
         
-        capture = self.board[to_row][to_col]
-        move_record = {
-            'piece': piece,
-            'from': (from_row, from_col),
-            'to': (to_row, to_col),
-            'captured': capture
-        }
-        self.move_history.append(move_record)
+        from_sq, to_sq, code, captured_code, flags = decode_move(
+            self.move_history.pop()
+        )
+        color_index = code // 6
+        index = self.piece_at[to_sq]
+        
+        move_mask = (1 << from_sq) | (1 << to_sq)
+        self.bb[code] ^= move_mask
+        self.occ_by_color[color_index] ^= move_mask
+        zobrist_to = self.ZOBRIST[to_sq]
+        self.hash ^= (self.ZOBRIST[from_sq][code] ^ zobrist_to[code] ^
+                      self.ZOBRIST_TURN)
         
-        self.board[to_row][to_col] = piece
-        self.board[from_row][from_col] = None
+        self.positions[index] = from_sq
+        self.piece_at[from_sq] = index
+        self.piece_at[to_sq] = -1
+        if flags & MOVE_FIRST:
+            self.pieces[index] ^= HAS_MOVED
         
-        piece.row = to_row
-        piece.col = to_col
-        piece.has_moved = True
+        if captured_code != NO_PIECE:
+            captured_index = self.captured.pop()
+            to_bit = 1 << to_sq
+            self.hash ^= zobrist_to[captured_code]
+            self.bb[captured_code] ^= to_bit
+            self.occ_by_color[color_index ^ 1] ^= to_bit
+            self.positions[captured_index] = to_sq
+            self.piece_at[to_sq] = captured_index
         
-        self.current_turn = (Color.BLACK if self.current_turn == Color.WHITE 
-                             else Color.WHITE)
+        self.occ_all = self.occ_by_color[0] | self.occ_by_color[1]
+        self.current_turn = color_index
         
         return True
 
 class ChessApp:
+    PIECE_COLORS = ('black', 'darkgray')
+    TURN_TEXT = ("White's Turn", "Black's Turn")
+
     def __init__(self, root):
         """
         Initialize the Chess Game GUI.
@@ -175,7 +532,8 @@ class ChessApp:
         self.root = root
         self.root.title("Advanced Chess Game")
         
-        self.BOARD_SIZE = 8
+        self.BOARD_SIZE = BOARD_SIZE
+        self.BOUNDS_MASK = BOUNDS_MASK
         self.SQUARE_SIZE = 80
         
         self.canvas = tk.Canvas(
@@ -202,37 +560,63 @@ class ChessApp:
         )
         self.status_label.pack(pady=5)
 
-    def _draw_board(self):
+    def _render_board_image(self):
         """
-        Draw the chessboard squares.
+        Render the checkered squares and grid lines into a PhotoImage.
+        
+        Returns:
+            tk.PhotoImage: Image of the empty board
         """
+        width = self.BOARD_SIZE * self.SQUARE_SIZE
+        image = tk.PhotoImage(width=width, height=width)
+        
         for row in range(self.BOARD_SIZE):
             for col in range(self.BOARD_SIZE):
                 color = 'white' if (row + col) % 2 == 0 else 'lightgray'
                 x1 = col * self.SQUARE_SIZE
                 y1 = row * self.SQUARE_SIZE
-                x2 = x1 + self.SQUARE_SIZE
-                y2 = y1 + self.SQUARE_SIZE
-                
-                self.canvas.create_rectangle(
-                    x1, y1, x2, y2, 
-                    fill=color, 
-                    outline='black'
-                )
-                
-                if col == 0:
-                    self.canvas.create_text(
-                        x1 + 10, y1 + 10, 
-                        text=str(self.BOARD_SIZE - row), 
-                        font=('Arial', 8)
-                    )
-                if row == self.BOARD_SIZE - 1:
-                    self.canvas.create_text(
-                        x1 + self.SQUARE_SIZE - 10, 
-                        y1 + self.SQUARE_SIZE - 10, 
-                        text=chr(97 + col), 
-                        font=('Arial', 8)
-                    )
+                image.put(color, to=(x1, y1, x1 + self.SQUARE_SIZE,
+                                     y1 + self.SQUARE_SIZE))
+        
+        for i in range(self.BOARD_SIZE + 1):
+            offset = min(i * self.SQUARE_SIZE, width - 1)
+            image.put('black', to=(offset, 0, offset + 1, width))
+            image.put('black', to=(0, offset, width, offset + 1))
+        
+        return image
+
+    def _draw_board(self):
+        """
+        Draw the chessboard squares and coordinate labels.
+        """
+        self.board_image = self._render_board_image()
+        self.canvas.create_image(0, 0, anchor='nw', image=self.board_image)
+        
+        for i in range(self.BOARD_SIZE):
+            offset = i * self.SQUARE_SIZE
+            self.canvas.create_text(
+                10, offset + 10,
+                text=str(self.BOARD_SIZE - i),
+                font=('Arial', 8)
+            )
+            self.canvas.create_text(
+                offset + self.SQUARE_SIZE - 10, 
+                self.BOARD_SIZE * self.SQUARE_SIZE - 10, 
+                text=chr(97 + i), 
+                font=('Arial', 8)
+            )
+
+    def _draw_piece(self, row, col, piece):
+        """
+        Create the canvas item for a piece on the given square.
+        """
+        self.drawn_pieces[(row, col)] = self.canvas.create_text(
+            col * self.SQUARE_SIZE + self.SQUARE_SIZE // 2,
+            row * self.SQUARE_SIZE + self.SQUARE_SIZE // 2,
+            text=piece.symbol,
+            font=('Arial', 36),
+            fill=self.PIECE_COLORS[piece.color]
+        )
 
     def _draw_pieces(self):
         """
@@ -244,19 +628,31 @@ class ChessApp:
         
         for row in range(self.BOARD_SIZE):
             for col in range(self.BOARD_SIZE):
-                piece = self.chess_board.board[row][col]
+                piece = self.chess_board.get_piece(row, col)
                 if piece:
-                    x = col * self.SQUARE_SIZE + self.SQUARE_SIZE // 2
-                    y = row * self.SQUARE_SIZE + self.SQUARE_SIZE // 2
-                    
-                    piece_text = self.canvas.create_text(
-                        x, y, 
-                        text=piece.symbol, 
-                        font=('Arial', 36),
-                        fill='black' if piece.color == Color.WHITE else 'darkgray'
-                    )
-                    
-                    self.drawn_pieces[(row, col)] = piece_text
+                    self._draw_piece(row, col, piece)
+
+    def _move_drawn_piece(self, source, destination):
+        """
+        Move the source square's piece item onto the destination square
+        with canvas.coords, deleting the item of any piece it captured.
+        
+        Args:
+            source (tuple): (row, col) the piece moved from
+            destination (tuple): (row, col) the piece moved to
+        """
+        captured = self.drawn_pieces.pop(destination, None)
+        if captured is not None:
+            self.canvas.delete(captured)
+        
+        row, col = destination
+        piece_text = self.drawn_pieces.pop(source)
+        self.canvas.coords(
+            piece_text,
+            col * self.SQUARE_SIZE + self.SQUARE_SIZE // 2,
+            row * self.SQUARE_SIZE + self.SQUARE_SIZE // 2
+        )
+        self.drawn_pieces[destination] = piece_text
 
     def on_square_click(self, event):
         """
@@ -268,25 +664,22 @@ class ChessApp:
         col = event.x // self.SQUARE_SIZE
         row = event.y // self.SQUARE_SIZE
         
-        if (0 <= row < self.BOARD_SIZE and 
-            0 <= col < self.BOARD_SIZE):
+        if not (row | col) & self.BOUNDS_MASK:
             
-            clicked_piece = self.chess_board.board[row][col]
+            clicked_piece = self.chess_board.get_piece(row, col)
             
             if self.selected_piece:
-                success = self.chess_board.move_piece(
+                move = self.chess_board.move_piece(
                     self.selected_piece.row, 
                     self.selected_piece.col, 
                     row, 
                     col
                 )
                 
-                if success:
-                    self._draw_pieces()
+                if move:
+                    self._move_drawn_piece(*move)
                     
-                    turn_text = ("White's Turn" if 
-                                 self.chess_board.current_turn == Color.WHITE 
-                                 else "Black's Turn")
+                    turn_text = self.TURN_TEXT[self.chess_board.current_turn]
                     self.status_label.config(text=turn_text)
                 
                 self.selected_piece = None
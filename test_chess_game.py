@@ -0,0 +1,240 @@
+import random
+import unittest
+from unittest import mock
+
+from chess_game import (
+    ChessBoard, Color, KING_ATTACKS, KNIGHT_ATTACKS, NO_PIECE, PAWN_ATTACKS,
+    PieceType, decode_move
+)
+
+
+def squares(mask):
+    return {divmod(sq, 8) for sq in range(64) if mask >> sq & 1}
+
+
+def moves(board, row, col):
+    return squares(board.get_piece(row, col).get_possible_moves())
+
+
+def snapshot(board):
+    return (
+        list(board.bb),
+        list(board.occ_by_color),
+        board.occ_all,
+        bytes(board.pieces),
+        list(board.positions),
+        list(board.piece_at),
+        board.current_turn,
+        board.hash,
+        len(board.move_history),
+        list(board.captured),
+    )
+
+
+class MakeUndoTest(unittest.TestCase):
+    def test_undo_restores_every_position(self):
+        board = ChessBoard()
+        rng = random.Random(1234)
+        history = [snapshot(board)]
+        
+        for _ in range(5000):
+            if board.move_history and rng.random() < 0.3:
+                self.assertTrue(board.undo_move())
+                history.pop()
+            elif board.move_piece(rng.randrange(8), rng.randrange(8),
+                                  rng.randrange(8), rng.randrange(8)):
+                history.append(snapshot(board))
+            self.assertEqual(snapshot(board), history[-1])
+            self.assertEqual(board.hash, board._compute_hash())
+        
+        while board.undo_move():
+            history.pop()
+            self.assertEqual(snapshot(board), history[-1])
+        self.assertEqual(len(history), 1)
+
+    def test_undo_capture(self):
+        board = ChessBoard()
+        initial = snapshot(board)
+        self.assertTrue(board.move_piece(6, 4, 1, 4))
+        self.assertEqual(board.get_piece(1, 4).color, Color.WHITE)
+        self.assertTrue(board.undo_move())
+        self.assertEqual(snapshot(board), initial)
+        self.assertEqual(board.get_piece(1, 4).color, Color.BLACK)
+
+    def test_current_turn_stays_int(self):
+        board = ChessBoard()
+        self.assertIs(type(board.current_turn), int)
+        self.assertTrue(board.move_piece(6, 4, 4, 4))
+        self.assertIs(type(board.current_turn), int)
+        self.assertEqual(board.current_turn, Color.BLACK)
+        self.assertTrue(board.undo_move())
+        self.assertIs(type(board.current_turn), int)
+        self.assertEqual(board.current_turn, Color.WHITE)
+
+    def test_undo_without_moves(self):
+        self.assertFalse(ChessBoard().undo_move())
+
+    def test_move_piece_reports_source_and_destination(self):
+        board = ChessBoard()
+        self.assertEqual(board.move_piece(6, 4, 4, 4), ((6, 4), (4, 4)))
+        self.assertEqual(board.move_piece(1, 3, 4, 4), ((1, 3), (4, 4)))
+        self.assertEqual(board.move_piece(7, 0, 7, 1), ())
+
+    def test_rejects_off_board_source(self):
+        board = ChessBoard()
+        initial = snapshot(board)
+        for row, col in ((8, -1), (-1, 0), (0, 8), (8, 0)):
+            self.assertFalse(board.move_piece(row, col, 5, 0))
+        self.assertEqual(snapshot(board), initial)
+
+    def test_rejects_other_sizes(self):
+        for size in (6, 9, 10, 16):
+            with self.assertRaises(ValueError):
+                ChessBoard(size)
+
+
+class MoveGenerationTest(unittest.TestCase):
+    def test_knight_attacks(self):
+        self.assertEqual(squares(KNIGHT_ATTACKS[0]), {(1, 2), (2, 1)})
+        self.assertEqual(squares(KNIGHT_ATTACKS[7]), {(1, 5), (2, 6)})
+        self.assertEqual(squares(KNIGHT_ATTACKS[3 * 8 + 3]), {
+            (1, 2), (1, 4), (2, 1), (2, 5), (4, 1), (4, 5), (5, 2), (5, 4)
+        })
+
+    def test_king_attacks(self):
+        self.assertEqual(squares(KING_ATTACKS[0]), {(0, 1), (1, 0), (1, 1)})
+        self.assertEqual(squares(KING_ATTACKS[4]),
+                         {(0, 3), (0, 5), (1, 3), (1, 4), (1, 5)})
+        self.assertEqual(len(squares(KING_ATTACKS[4 * 8 + 4])), 8)
+
+    def test_pawn_attacks(self):
+        white = PAWN_ATTACKS[Color.WHITE]
+        black = PAWN_ATTACKS[Color.BLACK]
+        self.assertEqual(squares(white[6 * 8 + 4]), {(5, 3), (5, 5)})
+        self.assertEqual(squares(white[6 * 8]), {(5, 1)})
+        self.assertEqual(white[0], 0)
+        self.assertEqual(squares(black[1 * 8 + 7]), {(2, 6)})
+        self.assertEqual(black[7 * 8 + 3], 0)
+
+    def test_start_position_moves(self):
+        board = ChessBoard()
+        self.assertEqual(moves(board, 7, 1), {(5, 0), (5, 2)})
+        self.assertEqual(moves(board, 0, 6), {(2, 5), (2, 7)})
+        self.assertEqual(moves(board, 6, 4), {(5, 4), (4, 4)})
+        self.assertEqual(moves(board, 1, 4), {(2, 4), (3, 4)})
+        for row, col in ((7, 0), (7, 2), (7, 3), (7, 4), (0, 7), (0, 5)):
+            self.assertEqual(moves(board, row, col), set())
+
+    def test_pawn_push_and_capture(self):
+        board = ChessBoard()
+        board.move_piece(6, 4, 4, 4)
+        board.move_piece(1, 3, 3, 3)
+        self.assertEqual(moves(board, 4, 4), {(3, 4), (3, 3)})
+        self.assertEqual(moves(board, 3, 3), {(4, 3), (4, 4)})
+        board.move_piece(6, 3, 5, 3)
+        board.move_piece(1, 4, 4, 3)
+        self.assertEqual(moves(board, 5, 3), set())
+
+    def test_sliding_moves(self):
+        board = ChessBoard()
+        board.move_piece(6, 4, 4, 4)
+        board.move_piece(1, 3, 3, 3)
+        board.move_piece(7, 0, 4, 0)
+        self.assertEqual(moves(board, 4, 0), {
+            (3, 0), (2, 0), (1, 0), (5, 0), (4, 1), (4, 2), (4, 3)
+        })
+        self.assertEqual(moves(board, 7, 5),
+                         {(6, 4), (5, 3), (4, 2), (3, 1), (2, 0)})
+        self.assertEqual(moves(board, 7, 3), {(6, 4), (5, 5), (4, 6), (3, 7)})
+        self.assertEqual(moves(board, 0, 2),
+                         {(1, 3), (2, 4), (3, 5), (4, 6), (5, 7)})
+
+
+class MoveHistoryTest(unittest.TestCase):
+    def test_iter_moves_decodes_history(self):
+        board = ChessBoard()
+        self.assertEqual(list(board.iter_moves()), [])
+        board.move_piece(6, 4, 4, 4)
+        board.move_piece(1, 3, 4, 4)
+        white_pawn = Color.WHITE * 6 + PieceType.PAWN
+        black_pawn = Color.BLACK * 6 + PieceType.PAWN
+        self.assertEqual(list(board.iter_moves()), [
+            (52, 36, white_pawn, NO_PIECE),
+            (11, 36, black_pawn, white_pawn),
+        ])
+        board.undo_move()
+        self.assertEqual(list(board.iter_moves()),
+                         [(52, 36, white_pawn, NO_PIECE)])
+
+    def test_history_uses_four_byte_items(self):
+        board = ChessBoard()
+        board.move_piece(7, 6, 5, 5)
+        self.assertEqual(board.move_history.itemsize, 4)
+        self.assertEqual(decode_move(board.move_history[0])[2:],
+                         (PieceType.KNIGHT, NO_PIECE, 1))
+
+
+class BoardScanTest(unittest.TestCase):
+    def test_find_king(self):
+        board = ChessBoard()
+        self.assertEqual(board.find_king(Color.WHITE), (7, 4))
+        self.assertEqual(board.find_king(Color.BLACK), (0, 4))
+        board.move_piece(7, 3, 0, 4)
+        self.assertIsNone(board.find_king(Color.BLACK))
+
+    def test_count_pieces(self):
+        board = ChessBoard()
+        self.assertEqual(board.count_pieces(Color.WHITE, PieceType.PAWN), 8)
+        self.assertEqual(board.count_pieces(Color.BLACK, PieceType.KNIGHT), 2)
+        self.assertEqual(board.count_pieces(Color.BLACK, PieceType.QUEEN), 1)
+        board.move_piece(6, 4, 1, 4)
+        self.assertEqual(board.count_pieces(Color.BLACK, PieceType.PAWN), 7)
+
+    def test_material(self):
+        board = ChessBoard()
+        self.assertEqual(board.material(Color.WHITE), 39)
+        self.assertEqual(board.material(Color.BLACK), 39)
+        board.move_piece(7, 3, 0, 3)
+        self.assertEqual(board.material(Color.BLACK), 30)
+        board.undo_move()
+        self.assertEqual(board.material(Color.BLACK), 39)
+
+
+class TranspositionTableTest(unittest.TestCase):
+    def test_probe_missing_position(self):
+        self.assertIsNone(ChessBoard().tt_probe())
+
+    def test_deeper_entry_is_kept(self):
+        board = ChessBoard()
+        board.tt_store(4, 10, ChessBoard.TT_EXACT)
+        board.tt_store(2, -5, ChessBoard.TT_LOWER)
+        self.assertEqual(board.tt_probe(), (10, 4, ChessBoard.TT_EXACT))
+
+    def test_same_depth_entry_is_overwritten(self):
+        board = ChessBoard()
+        board.tt_store(3, 10, ChessBoard.TT_EXACT)
+        board.tt_store(3, 7, ChessBoard.TT_UPPER)
+        self.assertEqual(board.tt_probe(), (7, 3, ChessBoard.TT_UPPER))
+
+    def test_entries_follow_the_position_hash(self):
+        board = ChessBoard()
+        board.tt_store(1, 10, ChessBoard.TT_EXACT)
+        board.move_piece(6, 4, 4, 4)
+        self.assertIsNone(board.tt_probe())
+        board.undo_move()
+        self.assertEqual(board.tt_probe(), (10, 1, ChessBoard.TT_EXACT))
+
+    def test_oldest_entry_is_evicted_when_full(self):
+        board = ChessBoard()
+        with mock.patch.object(ChessBoard, 'TT_MAX_ENTRIES', 2):
+            for h in (1, 2, 3):
+                board.hash = h
+                board.tt_store(1, h, ChessBoard.TT_EXACT)
+            board.hash = 2
+            board.tt_store(5, 20, ChessBoard.TT_EXACT)
+        self.assertEqual(list(board.tt), [2, 3])
+        self.assertEqual(board.tt[2], (20, 5, ChessBoard.TT_EXACT))
+
+
+if __name__ == "__main__":
+    unittest.main()